@@ -1,12 +1,69 @@
 """
 Modelle für die Darstellung von Filamentspulen-Daten
 """
+import math
+
+
+def _safe_coerce(value, target_type, default):
+    """
+    Konvertiert einen Wert in den Zieltyp
+    
+    Args:
+        value: Der zu konvertierende Wert
+        target_type (type): Der Zieltyp (z.B. str, int, float)
+        default: Rückgabewert, falls der Wert fehlt oder nicht konvertierbar ist
+        
+    Returns:
+        Der konvertierte Wert oder der Standardwert
+    """
+    # bool ist eine Unterklasse von int, aber kein gültiger Feldwert
+    if value is None or isinstance(value, bool):
+        return default
+    try:
+        if target_type is int and isinstance(value, str):
+            # Ganzzahlfelder akzeptieren auch Dezimalstrings wie "230.5" (gerundet)
+            try:
+                result = int(value)
+            except ValueError:
+                result = round(float(value))
+        elif target_type is int and isinstance(value, float):
+            # Gleitkommawerte runden statt abschneiden (230.9 -> 231)
+            result = round(value)
+        elif isinstance(value, target_type):
+            result = value
+        else:
+            result = target_type(value)
+    except (TypeError, ValueError, OverflowError):
+        return default
+    # nan und inf sind keine physikalisch sinnvollen Werte
+    if isinstance(result, float) and not math.isfinite(result):
+        return default
+    return result
 
 class FilamentSpool:
     """
     Klasse zur Repräsentation einer Filamentspule mit NFC-Daten
     """
     
+    # Feste Attributliste statt __dict__ pro Instanz (weniger Speicher,
+    # schnellerer Attributzugriff)
+    __slots__ = ('name', 'type', 'color', 'manufacturer', 'density', 'diameter',
+                 'nozzle_temp', 'bed_temp', 'remaining_length', 'remaining_weight')
+    
+    # Felder mit Zieltyp und Standardwert für from_dict (einmalig beim Laden der Klasse erstellt)
+    _FIELDS = (
+        ("name", str, ""),
+        ("type", str, "PLA"),
+        ("color", str, "#FFFFFF"),
+        ("manufacturer", str, ""),
+        ("density", float, 1.24),
+        ("diameter", float, 1.75),
+        ("nozzle_temp", int, 200),
+        ("bed_temp", int, 60),
+        ("remaining_length", float, 240.0),
+        ("remaining_weight", float, 1000.0)
+    )
+    
     def __init__(self, name="", type="PLA", color="#FFFFFF", manufacturer="", 
                  density=1.24, diameter=1.75, nozzle_temp=200, bed_temp=60, 
                  remaining_length=240, remaining_weight=1000):
@@ -62,20 +119,15 @@ class FilamentSpool:
         Erstellt eine Filamentspule aus einem Dictionary
         
         Args:
-            data (dict): Dictionary mit Filamentspulen-Daten
+            data (dict): Dictionary mit Filamentspulen-Daten. Werte werden in den
+                Typ des jeweiligen Feldes konvertiert (Gleitkommawerte für
+                Ganzzahlfelder werden gerundet); nicht konvertierbare Werte
+                werden durch den Standardwert ersetzt.
             
         Returns:
             FilamentSpool: Eine neue Filamentspule mit den gegebenen Daten
         """
-        return cls(
-            name=data.get("name", ""),
-            type=data.get("type", "PLA"),
-            color=data.get("color", "#FFFFFF"),
-            manufacturer=data.get("manufacturer", ""),
-            density=data.get("density", 1.24),
-            diameter=data.get("diameter", 1.75),
-            nozzle_temp=data.get("nozzle_temp", 200),
-            bed_temp=data.get("bed_temp", 60),
-            remaining_length=data.get("remaining_length", 240),
-            remaining_weight=data.get("remaining_weight", 1000)
-        )
+        return cls(**{
+            key: _safe_coerce(data.get(key, default), target_type, default)
+            for key, target_type, default in cls._FIELDS
+        })
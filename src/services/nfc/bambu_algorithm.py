@@ -14,10 +14,49 @@ import base64
 import hashlib
 import hmac
 import os
+import re
+import functools
 
 # Import the key derivation function from our module
 from .bambu_key import derive_bambu_key, CRYPTODOME_AVAILABLE
 
+# Color format accepted by the encoder (#RRGGBB)
+_HEX_COLOR = re.compile(r'#[0-9A-Fa-f]{6}')
+
+
+@functools.lru_cache(maxsize=32)
+def _keystream(key: bytes, length: int) -> int:
+    """
+    Expand a key to the given length and return it as an integer.
+    
+    The result only depends on the key and the payload length, so it is cached:
+    repeated reads and writes with the same tag key reuse the same keystream.
+    
+    Args:
+        key: The XOR key
+        length: Length of the data to XOR
+        
+    Returns:
+        The repeated key as little-endian integer
+    """
+    return int.from_bytes((key * (length // len(key) + 1))[:length], "little")
+
+
+def _xor_with_key(data: bytes, key: bytes) -> bytes:
+    """
+    XOR data with a repeating key in a single big-integer operation.
+    
+    Args:
+        data: The data to XOR
+        key: The key, repeated over the full length of the data
+        
+    Returns:
+        The XORed data
+    """
+    length = len(data)
+    result = int.from_bytes(data, "little") ^ _keystream(bytes(key), length)
+    return result.to_bytes(length, "little")
+
 
 class BambuLabNFCDecoder:
     """
@@ -171,14 +210,8 @@ class BambuLabNFCDecoder:
         Returns:
             Decrypted tag data
         """
-        decrypted = bytearray(data)
-        key_len = len(self._xor_key)
-        
         # Apply XOR to all data except header
-        for i in range(4, len(decrypted)):
-            decrypted[i] ^= self._xor_key[(i - 4) % key_len]
-            
-        return bytes(decrypted)
+        return bytes(data[:4]) + _xor_with_key(data[4:], self._xor_key)
     
     def _verify_checksum(self, data: bytes) -> bool:
         """
@@ -297,11 +330,10 @@ class BambuLabNFCDecoder:
         Returns:
             The extracted string
         """
-        end_pos = offset
-        for i in range(offset, offset + max_length):
-            if i >= len(data) or data[i] == 0:
-                end_pos = i
-                break
+        end_pos = offset + max_length
+        null_pos = data.find(b'\0', offset, end_pos)
+        if null_pos != -1:
+            end_pos = null_pos
                 
         return data[offset:end_pos].decode('utf-8', errors='replace')
 
@@ -410,12 +442,12 @@ class BambuLabNFCEncoder:
         # Encode color (3 bytes RGB)
         color = spool_info.get("color", "#FFFFFF")
         if color.startswith('#') and len(color) == 7:
-            r = int(color[1:3], 16)
-            g = int(color[3:5], 16)
-            b = int(color[5:7], 16)
+            if not _HEX_COLOR.fullmatch(color):
+                raise ValueError(f"Invalid color value: {color}")
+            rgb = bytes.fromhex(color[1:])
         else:
-            r, g, b = 255, 255, 255  # Default to white
-        buffer[offset:offset+3] = bytes([r, g, b])
+            rgb = b'\xff\xff\xff'  # Default to white
+        buffer[offset:offset+3] = rgb
         offset += 3
         
         # Encode diameter (4 bytes float)
@@ -484,11 +516,8 @@ class BambuLabNFCEncoder:
         Args:
             buffer: Buffer to encrypt
         """
-        key_len = len(self._xor_key)
-        
         # Apply XOR to all data except the header signature
-        for i in range(4, len(buffer)):
-            buffer[i] ^= self._xor_key[(i - 4) % key_len]
+        buffer[4:] = _xor_with_key(buffer[4:], self._xor_key)
     
     def _encode_string(self, buffer: bytearray, offset: int, string: str, max_length: int) -> None:
         """
@@ -9,7 +9,8 @@ import os
 import sys
 import hmac
 import hashlib
-from typing import Optional
+import functools
+from typing import List, Optional
 
 # Path to the Bambu Research Group repository submodule
 BAMBU_RESEARCH_PATH = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'vendor', 'bambu-research'))
@@ -144,3 +145,46 @@ if not CRYPTODOME_AVAILABLE:
         
     except ImportError:
         pass
+
+
+# Keep a reference to the selected implementation before wrapping it
+_derive_bambu_key_uncached = derive_bambu_key
+
+
+@functools.lru_cache(maxsize=256)
+def _derive_bambu_key_cached(uid: bytes) -> bytes:
+    """Cached call of the selected key derivation implementation."""
+    return _derive_bambu_key_uncached(uid)
+
+
+def derive_bambu_key(uid: bytes) -> bytes:
+    """
+    Derive the encryption key for a Bambu Lab RFID tag based on its UID.
+    
+    The derivation is deterministic per UID, so results are cached: encoders
+    and decoders for the same tag share one KDF invocation.
+    
+    Args:
+        uid: The UID of the RFID tag (bytes, bytearray or memoryview)
+        
+    Returns:
+        The derived key as bytes
+    """
+    # Unhashable byte buffers are converted for the cache; other types are
+    # passed through unchanged and rejected by the implementation
+    if isinstance(uid, (bytearray, memoryview)):
+        uid = bytes(uid)
+    return _derive_bambu_key_cached(uid)
+
+
+def derive_bambu_keys_batch(uids: List[bytes]) -> List[bytes]:
+    """
+    Derive the encryption keys for several Bambu Lab RFID tags.
+    
+    Args:
+        uids: The UIDs of the RFID tags
+        
+    Returns:
+        The derived keys, in the same order as the UIDs
+    """
+    return [derive_bambu_key(uid) for uid in uids]
@@ -325,6 +325,9 @@ class NFCDevice:
             else:
                 data_dict = data
                 
+            # Zeitstempel einmalig bestimmen, damit Seriennummer und Datum übereinstimmen
+            timestamp = int(time.time())
+            
             # Bereite die Daten für den Bambu Lab NFC Encoder vor
             tag_data = {
                 "version": 1,
@@ -342,8 +345,8 @@ class NFCDevice:
                     "name": data_dict.get("name", "")
                 },
                 "manufacturing_info": {
-                    "serial": f"SC{int(time.time())}", # Generiere eine eindeutige Seriennummer
-                    "date": int(time.time()) # Aktuelles Datum als Unix-Timestamp
+                    "serial": f"SC{timestamp}", # Generiere eine eindeutige Seriennummer
+                    "date": timestamp # Aktuelles Datum als Unix-Timestamp
                 }
             }
             
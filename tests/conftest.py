@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration for the Spool-Coder tests
+"""
+import sys
+from pathlib import Path
+
+# Make the project root importable once per session, so test modules can use
+# "from src..." imports without manipulating sys.path themselves
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
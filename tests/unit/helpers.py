@@ -0,0 +1,64 @@
+"""
+Shared helpers for the unit tests
+"""
+import sys
+from unittest.mock import MagicMock
+
+# Keep a reference so the QApplication is not garbage collected between test modules
+_application = None
+
+
+def get_application():
+    """
+    Get the QApplication for UI tests, creating it on first use
+
+    PyQt6 is only imported when this is called, so modules importing the
+    helpers do not pull in Qt at import time.
+
+    Returns:
+        QApplication: The shared application instance
+    """
+    global _application
+    if _application is None:
+        from PyQt6.QtWidgets import QApplication
+        _application = QApplication.instance() or QApplication(sys.argv)
+    return _application
+
+
+def destroy_widget(widget):
+    """
+    Destroy a widget created by a test immediately
+
+    deleteLater() would wait for an event loop that never runs during the
+    tests, so the C++ object is deleted directly. close() is not called,
+    because closeEvent may ask for confirmation in a modal dialog
+    (e.g. MainWindow).
+
+    Args:
+        widget (QWidget): The widget to destroy
+    """
+    from PyQt6 import sip
+    sip.delete(widget)
+
+
+class FakeNFCDevice:
+    """
+    Lightweight stand-in for NFCDevice in the view tests
+
+    Only provides the methods the views call. Each method is a MagicMock, so
+    return values and call assertions work as usual, without the class
+    introspection of MagicMock(spec=NFCDevice).
+    """
+
+    def __init__(self):
+        self.connect = MagicMock(return_value=True)
+        self.disconnect = MagicMock()
+        self.is_connected = MagicMock(return_value=False)
+        self.read_tag = MagicMock()
+        self.write_tag = MagicMock()
+
+    def reset_mock(self):
+        """Reset the recorded calls of all methods"""
+        for method in (self.connect, self.disconnect, self.is_connected,
+                       self.read_tag, self.write_tag):
+            method.reset_mock()
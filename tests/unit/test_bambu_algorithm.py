@@ -3,35 +3,44 @@ Tests for the BambuLab NFC algorithm
 """
 import unittest
 import base64
+from math import isclose
+from types import MappingProxyType
 from src.services.nfc.bambu_algorithm import BambuLabNFCEncoder, BambuLabNFCDecoder, SAMPLE_TAG_DATA
 
 
 class TestBambuLabNFCAlgorithm(unittest.TestCase):
     """Test cases for the BambuLab NFC algorithm"""
     
-    def setUp(self):
-        """Set up the test case"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests"""
         # Use consistent UID for both encoder and decoder
-        self.test_uid = b'\xaa\x55\xcc\x33'
-        self.encoder = BambuLabNFCEncoder(tag_uid=self.test_uid)
-        self.decoder = BambuLabNFCDecoder()
-        self.test_data = SAMPLE_TAG_DATA.copy()
+        cls.test_uid = b'\xaa\x55\xcc\x33'
+        cls.encoder = BambuLabNFCEncoder(tag_uid=cls.test_uid)
+        cls.decoder = BambuLabNFCDecoder()
+        # Read-only view of the sample data, including the nested sections, so
+        # no test can change SAMPLE_TAG_DATA for the others; tests that need
+        # different data build their own dict
+        cls.test_data = MappingProxyType({
+            key: MappingProxyType(value) if isinstance(value, dict) else value
+            for key, value in SAMPLE_TAG_DATA.items()
+        })
+        # Encode the sample data once; tests only read the encoded bytes
+        cls._encoded = cls.encoder.encode_tag_data(cls.test_data)
     
     def test_encoder_creates_valid_data(self):
         """Test that the encoder creates a valid data structure"""
-        encoded = self.encoder.encode_tag_data(self.test_data)
+        encoded = self._encoded
         
         # Check that the data is not empty
-        self.assertIsNotNone(encoded)
-        self.assertGreater(len(encoded), 0)
+        self.assertTrue(encoded)
         
         # Check that the data starts with the correct header
         self.assertEqual(encoded[:4], BambuLabNFCDecoder.TAG_HEADER)
     
     def test_encode_decode_roundtrip(self):
         """Test that encoding and then decoding preserves the original data"""
-        # Encode the test data
-        encoded = self.encoder.encode_tag_data(self.test_data)
+        encoded = self._encoded
         
         # Decode it back
         decoded = self.decoder.decode_tag_data(encoded, tag_uid=self.test_uid)
@@ -45,12 +54,13 @@ class TestBambuLabNFCAlgorithm(unittest.TestCase):
         
         self.assertEqual(result["type"], original["type"])
         self.assertEqual(result["color"], original["color"])
-        self.assertAlmostEqual(result["diameter"], original["diameter"], places=2)
         self.assertEqual(result["nozzle_temp"], original["nozzle_temp"])
         self.assertEqual(result["bed_temp"], original["bed_temp"])
-        self.assertAlmostEqual(result["density"], original["density"], places=3)
-        self.assertAlmostEqual(result["remaining_length"], original["remaining_length"], places=1)
-        self.assertLessEqual(abs(result["remaining_weight"] - original["remaining_weight"]), 1)  # Allow small rounding differences
+        # Numeric fields may differ by small rounding errors
+        for field, tolerance in [("diameter", 0.01), ("density", 0.001),
+                                 ("remaining_length", 0.1), ("remaining_weight", 1)]:
+            self.assertTrue(isclose(result[field], original[field], abs_tol=tolerance),
+                            f"{field}: {result[field]} != {original[field]}")
         self.assertEqual(result["manufacturer"], original["manufacturer"])
         self.assertEqual(result["name"], original["name"])
         
@@ -63,15 +73,13 @@ class TestBambuLabNFCAlgorithm(unittest.TestCase):
     
     def test_data_corruption_detection(self):
         """Test that corrupted data is detected"""
-        # Encode the test data
-        encoded = self.encoder.encode_tag_data(self.test_data)
+        encoded = self._encoded
         
         # Corrupt the data by changing a byte in the middle
-        corrupted = bytearray(encoded)
-        corrupted[100] = (corrupted[100] + 1) % 256
+        corrupted = encoded[:100] + bytes([(encoded[100] + 1) & 0xFF]) + encoded[101:]
         
         # Decoding should fail (return None)
-        result = self.decoder.decode_tag_data(bytes(corrupted))
+        result = self.decoder.decode_tag_data(corrupted)
         self.assertIsNone(result)
         
         # But the original should still decode correctly
@@ -80,15 +88,13 @@ class TestBambuLabNFCAlgorithm(unittest.TestCase):
     
     def test_header_validation(self):
         """Test that the header is correctly validated"""
-        # Encode the test data
-        encoded = self.encoder.encode_tag_data(self.test_data)
+        encoded = self._encoded
         
         # Corrupt the header
-        corrupted = bytearray(encoded)
-        corrupted[0] = (corrupted[0] + 1) % 256  # Change the first byte of the header
+        corrupted = bytes([(encoded[0] + 1) & 0xFF]) + encoded[1:]  # Change the first byte of the header
         
         # Decoding should fail
-        result = self.decoder.decode_tag_data(bytes(corrupted))
+        result = self.decoder.decode_tag_data(corrupted)
         self.assertIsNone(result)
     
     def test_various_filament_types(self):
@@ -96,27 +102,51 @@ class TestBambuLabNFCAlgorithm(unittest.TestCase):
         filament_types = ["PLA", "PETG", "ABS", "TPU", "ASA"]
         
         for filament_type in filament_types:
-            # Update test data with this filament type
-            self.test_data["spool_data"]["type"] = filament_type
-            
-            # Encode and decode
-            encoded = self.encoder.encode_tag_data(self.test_data)
-            decoded = self.decoder.decode_tag_data(encoded, tag_uid=self.test_uid)
-            
-            # Verify the filament type was preserved
-            self.assertEqual(decoded["spool_data"]["type"], filament_type)
+            with self.subTest(filament_type=filament_type):
+                # Build fresh test data with this filament type (SAMPLE_TAG_DATA stays untouched)
+                data = {**self.test_data, "spool_data": {**self.test_data["spool_data"], "type": filament_type}}
+                
+                # Encode and decode
+                encoded = self.encoder.encode_tag_data(data)
+                decoded = self.decoder.decode_tag_data(encoded, tag_uid=self.test_uid)
+                
+                # Verify the filament type was preserved
+                self.assertEqual(decoded["spool_data"]["type"], filament_type)
+    
+    def test_invalid_hex_color_raises(self):
+        """Test that a #RRGGBB-shaped color with non-hex digits is rejected"""
+        data = {**self.test_data, "spool_data": {**self.test_data["spool_data"], "color": "#GGGGGG"}}
+        with self.assertRaises(ValueError):
+            self.encoder.encode_tag_data(data)
+    
+    def test_invalid_color_defaults_to_white(self):
+        """Test that colors not in #RRGGBB format are encoded as white"""
+        for color in ["00FF00", "#FFFF", "#00FF00FF"]:
+            with self.subTest(color=color):
+                data = {**self.test_data, "spool_data": {**self.test_data["spool_data"], "color": color}}
+                encoded = self.encoder.encode_tag_data(data)
+                decoded = self.decoder.decode_tag_data(encoded, tag_uid=self.test_uid)
+                self.assertEqual(decoded["spool_data"]["color"], "#FFFFFF")
+    
+    def test_extract_string_without_terminator(self):
+        """Test that string fields without a null byte are read up to their end"""
+        # Unterminated field: the whole field is returned
+        self.assertEqual(self.decoder._extract_string(b'A' * 40, 0, 32), 'A' * 32)
+        # Field ending at the end of the buffer
+        self.assertEqual(self.decoder._extract_string(b'AB', 0, 32), 'AB')
+        # Terminated field stops at the null byte
+        self.assertEqual(self.decoder._extract_string(b'AB\0CD', 0, 32), 'AB')
     
     def test_base64_encoding_decoding(self):
         """Test base64 encoding and decoding of tag data"""
-        # Encode the test data
-        encoded = self.encoder.encode_tag_data(self.test_data)
+        encoded = self._encoded
         
         # Convert to base64 (useful for storing in databases or transferring)
         base64_data = base64.b64encode(encoded).decode('ascii')
         self.assertIsNotNone(base64_data)
         
-        # Decode from base64
-        decoded_bytes = base64.b64decode(base64_data)
+        # Decode from base64 (rejecting any characters outside the alphabet)
+        decoded_bytes = base64.b64decode(base64_data, validate=True)
         self.assertEqual(decoded_bytes, encoded)
         
         # Parse the decoded data
@@ -3,25 +3,24 @@ Tests for the FilamentDetailWidget UI component
 """
 import unittest
 from unittest.mock import patch, MagicMock
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QColor
-import sys
-
-# Create a QApplication instance for tests
-app = QApplication.instance()
-if not app:
-    app = QApplication(sys.argv)
+import pytest
 
 from src.ui.components.filament_detail_widget import FilamentDetailWidget
 from src.models.filament import FilamentSpool
+from tests.unit.helpers import destroy_widget, get_application
+
+# Qt widget tests; deselect with -m "not gui"
+pytestmark = pytest.mark.gui
 
 class TestFilamentDetailWidget(unittest.TestCase):
     """Test cases for the FilamentDetailWidget class"""
     
-    def setUp(self):
-        """Set up test cases"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests"""
+        get_application()
         # Create a sample FilamentSpool for testing
-        self.test_spool = FilamentSpool(
+        cls.test_spool = FilamentSpool(
             name="Test PLA",
             type="PLA",
             color="#00FF00",
@@ -34,12 +33,17 @@ class TestFilamentDetailWidget(unittest.TestCase):
             remaining_weight=1000
         )
         
-        # Create FilamentDetailWidget instance for testing
-        self.widget = FilamentDetailWidget()
+        # Create one FilamentDetailWidget instance for all tests
+        cls.widget = FilamentDetailWidget()
     
-    def tearDown(self):
-        """Clean up after each test"""
-        self.widget.deleteLater()
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests"""
+        destroy_widget(cls.widget)
+    
+    def setUp(self):
+        """Reset the form before each test"""
+        self.widget.clear_form()
     
     def test_init(self):
         """Test initialization of FilamentDetailWidget"""
@@ -60,20 +64,31 @@ class TestFilamentDetailWidget(unittest.TestCase):
         self.widget.fill_form(self.test_spool)
         
         # Check if form fields are filled with correct data
-        self.assertEqual(self.widget.name_edit.text(), "Test PLA")
-        self.assertEqual(self.widget.type_combo.currentText(), "PLA")
-        self.assertEqual(self.widget.manufacturer_edit.text(), "TestMaker")
-        self.assertEqual(self.widget.density_spin.value(), 1.24)
-        self.assertEqual(self.widget.diameter_combo.currentText(), "1.75")
-        self.assertEqual(self.widget.nozzle_temp_spin.value(), 210)
-        self.assertEqual(self.widget.bed_temp_spin.value(), 60)
-        self.assertEqual(self.widget.remaining_length_spin.value(), 240)
-        self.assertEqual(self.widget.remaining_weight_spin.value(), 1000)
-        
-        # Check color (stored in color_edit field and color_preview widget)
-        color = QColor(self.test_spool.color)
-        stored_color = self.widget.color_edit.text()
-        self.assertEqual(stored_color.lower(), color.name().lower())
+        # (color is stored in the color_edit field and color_preview widget)
+        actual = {
+            "name": self.widget.name_edit.text(),
+            "type": self.widget.type_combo.currentText(),
+            "color": self.widget.color_edit.text().lower(),
+            "manufacturer": self.widget.manufacturer_edit.text(),
+            "density": self.widget.density_spin.value(),
+            "diameter": self.widget.diameter_combo.currentText(),
+            "nozzle_temp": self.widget.nozzle_temp_spin.value(),
+            "bed_temp": self.widget.bed_temp_spin.value(),
+            "remaining_length": self.widget.remaining_length_spin.value(),
+            "remaining_weight": self.widget.remaining_weight_spin.value()
+        }
+        self.assertDictEqual(actual, {
+            "name": "Test PLA",
+            "type": "PLA",
+            "color": "#00ff00",
+            "manufacturer": "TestMaker",
+            "density": 1.24,
+            "diameter": "1.75",
+            "nozzle_temp": 210,
+            "bed_temp": 60,
+            "remaining_length": 240,
+            "remaining_weight": 1000
+        })
     
     def test_get_form_data(self):
         """Test getting form data as FilamentSpool"""
@@ -84,18 +99,19 @@ class TestFilamentDetailWidget(unittest.TestCase):
         result_spool = self.widget.get_form_data()
         
         # Check if result spool has correct data
-        self.assertEqual(result_spool.name, "Test PLA")
-        self.assertEqual(result_spool.type, "PLA")
-        # Verify that the color is normalized to lowercase hexadecimal format
-        expected_color = "#00ff00"
-        self.assertEqual(result_spool.color, expected_color)
-        self.assertEqual(result_spool.manufacturer, "TestMaker")
-        self.assertEqual(result_spool.density, 1.24)
-        self.assertEqual(result_spool.diameter, 1.75)
-        self.assertEqual(result_spool.nozzle_temp, 210)
-        self.assertEqual(result_spool.bed_temp, 60)
-        self.assertEqual(result_spool.remaining_length, 240)
-        self.assertEqual(result_spool.remaining_weight, 1000)
+        # (the color is normalized to lowercase hexadecimal format)
+        self.assertDictEqual(result_spool.to_dict(), {
+            "name": "Test PLA",
+            "type": "PLA",
+            "color": "#00ff00",
+            "manufacturer": "TestMaker",
+            "density": 1.24,
+            "diameter": 1.75,
+            "nozzle_temp": 210,
+            "bed_temp": 60,
+            "remaining_length": 240,
+            "remaining_weight": 1000
+        })
     
     def test_clear_form(self):
         """Test clearing the form"""
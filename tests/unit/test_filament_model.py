@@ -106,5 +106,64 @@ class TestFilamentSpool(unittest.TestCase):
         self.assertEqual(spool.density, 1.24)      # Default from from_dict
         self.assertEqual(spool.diameter, 1.75)     # Default from from_dict
 
+    def test_from_dict_coerces_types(self):
+        """Test that from_dict converts values to the field types"""
+        spool = FilamentSpool.from_dict({
+            "name": 123,
+            "density": "1.27",
+            "nozzle_temp": "230",
+            "bed_temp": 80.0,
+            "remaining_weight": 950
+        })
+
+        self.assertEqual(spool.name, "123")
+        self.assertEqual(spool.density, 1.27)
+        self.assertEqual(spool.nozzle_temp, 230)
+        self.assertIsInstance(spool.bed_temp, int)
+        self.assertIsInstance(spool.remaining_weight, float)
+
+    def test_from_dict_with_invalid_values(self):
+        """Test that unconvertible values fall back to the defaults"""
+        spool = FilamentSpool.from_dict({
+            "name": None,
+            "density": "dense",
+            "nozzle_temp": [210],
+            "bed_temp": True,
+            "remaining_length": float("inf"),
+            "remaining_weight": float("nan")
+        })
+
+        self.assertEqual(spool.name, "")
+        self.assertEqual(spool.density, 1.24)
+        self.assertEqual(spool.nozzle_temp, 200)
+        self.assertEqual(spool.bed_temp, 60)
+        self.assertEqual(spool.remaining_length, 240)
+        self.assertEqual(spool.remaining_weight, 1000)
+
+        # Fallback defaults keep the field type
+        self.assertIsInstance(spool.density, float)
+        self.assertIsInstance(spool.nozzle_temp, int)
+        self.assertIsInstance(spool.bed_temp, int)
+        self.assertIsInstance(spool.remaining_length, float)
+        self.assertIsInstance(spool.remaining_weight, float)
+
+    def test_from_dict_rounds_decimals_for_int_fields(self):
+        """Test that decimal values are rounded for integer fields"""
+        spool = FilamentSpool.from_dict({"nozzle_temp": 230.9, "bed_temp": "59.6"})
+        self.assertEqual(spool.nozzle_temp, 231)
+        self.assertEqual(spool.bed_temp, 60)
+
+        spool = FilamentSpool.from_dict({"nozzle_temp": "230.4", "bed_temp": "inf"})
+        self.assertEqual(spool.nozzle_temp, 230)
+        self.assertEqual(spool.bed_temp, 60)
+
+    def test_slots(self):
+        """Test that FilamentSpool uses __slots__ instead of a per-instance __dict__"""
+        self.assertFalse(hasattr(self.test_spool, "__dict__"))
+
+        # Unknown attributes cannot be assigned
+        with self.assertRaises(AttributeError):
+            self.test_spool.serial_number = "SN123"
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,119 +2,117 @@
 Unit test for the key derivation function from the Bambu-Research-Group repository.
 """
 
-import sys
 import os
 import binascii
 import unittest
+from unittest.mock import patch
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src')))
+from src.services.nfc.bambu_key import derive_bambu_key, derive_bambu_keys_batch, CRYPTODOME_AVAILABLE, _derive_bambu_key_uncached
+from src.services.nfc.bambu_algorithm import BambuLabNFCEncoder, BambuLabNFCDecoder, SAMPLE_TAG_DATA
+
+# Sample tag UIDs
+UID_11223344 = b"\x11\x22\x33\x44"
+UID_44332211 = b"\x44\x33\x22\x11"
+# Example UID from the Bambu research
+UID_BAMBU = b"\x75\x88\x6B\x1D"
 
 class TestKeyDerivation(unittest.TestCase):
     """Test suite for key derivation functionality"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        # Import our key derivation module
-        from src.services.nfc.bambu_key import derive_bambu_key, CRYPTODOME_AVAILABLE
-        from src.services.nfc.bambu_algorithm import BambuLabNFCEncoder, BambuLabNFCDecoder
-        
-        self.derive_bambu_key = derive_bambu_key
-        self.CRYPTODOME_AVAILABLE = CRYPTODOME_AVAILABLE
-        self.BambuLabNFCEncoder = BambuLabNFCEncoder
-        self.BambuLabNFCDecoder = BambuLabNFCDecoder
-    
     def test_key_derivation_basic(self):
         """Test basic key derivation functionality"""
         # Sample UID
-        uid = bytes.fromhex("11223344")
+        uid = UID_11223344
         
         # Derive key
-        key = self.derive_bambu_key(uid)
+        key = derive_bambu_key(uid)
         
         self.assertIsInstance(key, bytes)
-        self.assertGreater(len(key), 0)
+        self.assertTrue(key)
         self.assertEqual(uid.hex(), "11223344")
     
+    def test_key_derivation_byte_buffers(self):
+        """Test that bytearray and memoryview UIDs derive the same key as bytes"""
+        key = derive_bambu_key(UID_11223344)
+        
+        self.assertEqual(derive_bambu_key(bytearray(UID_11223344)), key)
+        self.assertEqual(derive_bambu_key(memoryview(UID_11223344)), key)
+    
+    def test_key_derivation_invalid_type(self):
+        """Test that UIDs which are not byte buffers are rejected"""
+        with self.assertRaises(TypeError):
+            derive_bambu_key(4)
+    
+    def test_key_derivation_cached(self):
+        """Test that repeated derivations for the same UID run the KDF only once"""
+        # Random UID, so no earlier test has derived (and cached) it yet
+        uid = os.urandom(7)
+        
+        with patch('src.services.nfc.bambu_key._derive_bambu_key_uncached',
+                   wraps=_derive_bambu_key_uncached) as mock_derive:
+            key = derive_bambu_key(uid)
+            self.assertEqual(derive_bambu_key(bytearray(uid)), key)
+        
+        mock_derive.assert_called_once_with(uid)
+    
     def test_cryptodome_availability(self):
         """Test that pycryptodomex is available"""
-        self.assertTrue(self.CRYPTODOME_AVAILABLE, "pycryptodomex should be available")
+        self.assertTrue(CRYPTODOME_AVAILABLE, "pycryptodomex should be available")
     
     def test_encoder_decoder_consistency(self):
         """Test that encoder and decoder use consistent keys"""
-        uid = bytes.fromhex("11223344")
+        uid = UID_11223344
         
-        encoder = self.BambuLabNFCEncoder(tag_uid=uid)
-        decoder = self.BambuLabNFCDecoder(tag_uid=uid)
+        encoder = BambuLabNFCEncoder(tag_uid=uid)
+        decoder = BambuLabNFCDecoder(tag_uid=uid)
         
         # Keys should be the same
         self.assertEqual(encoder._xor_key, decoder._xor_key)
     
     def test_different_uids_different_keys(self):
         """Test that different UIDs produce different keys"""
-        uid1 = bytes.fromhex("11223344")
-        uid2 = bytes.fromhex("44332211")
+        uid1 = UID_11223344
+        uid2 = UID_44332211
         
-        key1 = self.derive_bambu_key(uid1)
-        key2 = self.derive_bambu_key(uid2)
+        key1, key2 = derive_bambu_keys_batch([uid1, uid2])
+        
+        # Batch derivation must match single derivation
+        self.assertEqual(key1, derive_bambu_key(uid1))
         
         self.assertNotEqual(key1, key2)
 
-def test_key_derivation():
-    """Legacy function for backwards compatibility"""
-    # Import required modules
-    from src.services.nfc.bambu_key import derive_bambu_key, CRYPTODOME_AVAILABLE
-    from src.services.nfc.bambu_algorithm import BambuLabNFCEncoder, BambuLabNFCDecoder
-    
-    # Sample UID
-    uid = bytes.fromhex("11223344")
-    
-    # Derive key
-    key = derive_bambu_key(uid)
-    
-    print(f"UID: {uid.hex()}")
-    print(f"Derived key: {key.hex()}")
-    print(f"Using pycryptodomex: {CRYPTODOME_AVAILABLE}")
-    
-    # Also test the encoder and decoder with the derived key
-    print("\nTesting encoder and decoder with derived key...")
-    encoder = BambuLabNFCEncoder(tag_uid=uid)
-    decoder = BambuLabNFCDecoder(tag_uid=uid)
-    
-    # Check that they're using the same key
-    print(f"Encoder key: {encoder._xor_key.hex()}")
-    print(f"Decoder key: {decoder._xor_key.hex()}")
-    
-    # Now test a full encoding/decoding cycle using the derived key
-    print("\nTesting full encode/decode cycle with derived key...")
-    from src.services.nfc.bambu_algorithm import SAMPLE_TAG_DATA
-    
-    # Encode some data
-    encoded_data = encoder.encode_tag_data(SAMPLE_TAG_DATA)
-    
-    # Decode it back
-    decoded_data = decoder.decode_tag_data(encoded_data)
-    
-    # Verify it worked
-    if decoded_data:
-        print("Successfully decoded tag data with derived key!")
-        print(f"Filament type: {decoded_data['spool_data']['type']}")
-        print(f"Manufacturer: {decoded_data['spool_data']['manufacturer']}")
-        print(f"Name: {decoded_data['spool_data']['name']}")
+    def test_bambu_example_uid(self):
+        """Test with the example UID from the Bambu research"""
+        uid = UID_BAMBU
+        key = derive_bambu_key(uid)
         
-        # Assert that the decode was successful (proper test assertion)
-        assert decoded_data is not None, "Decoded data should not be None"
-        assert 'spool_data' in decoded_data, "Decoded data should contain spool_data"
-    else:
-        print("Failed to decode tag data with derived key!")
-        assert False, "Failed to decode tag data with derived key!"
-    
-    # Return None to fix pytest warning (tests should not return values)
-    return None
+        # The exact key depends on whether we're using pycryptodomex or fallback
+        if CRYPTODOME_AVAILABLE:
+            # This should match the first key from the original deriveKeys.py
+            expected_start = "6E5B0EC6EF7C"
+            actual_key_hex = key.hex().upper()
+            self.assertTrue(actual_key_hex.startswith(expected_start),
+                           f"Expected key to start with {expected_start}, got {actual_key_hex}")
+        else:
+            # With fallback implementation, just verify key consistency
+            # Bypass the cache, otherwise the cached key is compared with itself
+            key = _derive_bambu_key_uncached(uid)
+            key2 = _derive_bambu_key_uncached(uid)
+            self.assertEqual(key, key2, "Key derivation should be consistent")
+            self.assertIsInstance(key, bytes)
+            self.assertTrue(key)
+
+    def test_roundtrip_with_derived_key(self):
+        """Test a full encode/decode cycle using the key derived from the UID"""
+        encoder = BambuLabNFCEncoder(tag_uid=UID_11223344)
+        decoder = BambuLabNFCDecoder(tag_uid=UID_11223344)
+        
+        decoded = decoder.decode_tag_data(encoder.encode_tag_data(SAMPLE_TAG_DATA))
+        
+        self.assertIsNotNone(decoded, "Failed to decode tag data with derived key")
+        self.assertEqual(decoded["spool_data"]["type"], SAMPLE_TAG_DATA["spool_data"]["type"])
+        self.assertEqual(decoded["spool_data"]["manufacturer"], SAMPLE_TAG_DATA["spool_data"]["manufacturer"])
+        self.assertEqual(decoded["spool_data"]["name"], SAMPLE_TAG_DATA["spool_data"]["name"])
 
 if __name__ == "__main__":
-    # Run tests if called directly
-    if len(sys.argv) > 1 and sys.argv[1] == "test":
-        test_key_derivation()
-    else:
-        unittest.main()
+    unittest.main()
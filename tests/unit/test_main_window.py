@@ -3,31 +3,36 @@ Tests for the MainWindow UI component
 """
 import unittest
 from unittest.mock import patch, MagicMock
-from PyQt6.QtWidgets import QApplication, QStackedWidget, QPushButton, QLabel
+import pytest
+from PyQt6.QtWidgets import QStackedWidget, QPushButton, QLabel
 from PyQt6.QtGui import QAction
-import sys
-
-# Create a QApplication instance for tests
-app = QApplication.instance()
-if not app:
-    app = QApplication(sys.argv)
 
 from src.ui.views.main_window import MainWindow
 from src.ui.views.read_view import ReadView
 from src.ui.views.write_view import WriteView
 from src.ui.views.info_view import InfoView
+from tests.unit.helpers import destroy_widget, get_application
+
+# Qt widget tests; deselect with -m "not gui"
+pytestmark = pytest.mark.gui
 
 class TestMainWindow(unittest.TestCase):
     """Test cases for the MainWindow class"""
     
-    def setUp(self):
-        """Set up test cases"""
-        # Create MainWindow instance for testing
-        self.main_window = MainWindow()
+    @classmethod
+    def setUpClass(cls):
+        """Create one MainWindow shared by all (read-only) tests"""
+        get_application()
+        cls.main_window = MainWindow()
     
-    def tearDown(self):
-        """Clean up after each test"""
-        self.main_window.close()
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests"""
+        destroy_widget(cls.main_window)
+    
+    def setUp(self):
+        """Reset state between tests"""
+        self.main_window.statusBar.clearMessage()
     
     def test_init(self):
         """Test initialization of MainWindow"""
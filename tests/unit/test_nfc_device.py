@@ -3,20 +3,17 @@ Tests for the NFCDevice service
 """
 import unittest
 from unittest.mock import patch, MagicMock
+from types import MappingProxyType
 from src.services.nfc.device import NFCDevice
 
 class TestNFCDevice(unittest.TestCase):
     """Test cases for the NFCDevice class"""
     
-    def setUp(self):
-        """Set up test cases"""
-        # Create an NFC device for testing
-        self.device = NFCDevice(port="TEST_PORT")
-        # Enable testing mode to ensure consistent behavior
-        self.device._testing_mode = True
-        
-        # Sample data for testing
-        self.test_data = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests"""
+        # Sample data for testing (read-only, shared by all tests)
+        cls.TEST_DATA = MappingProxyType({
             "name": "Test PLA",
             "type": "PLA",
             "color": "#00FF00",
@@ -27,7 +24,14 @@ class TestNFCDevice(unittest.TestCase):
             "bed_temp": 60,
             "remaining_length": 240,
             "remaining_weight": 1000
-        }
+        })
+    
+    def setUp(self):
+        """Set up test cases"""
+        # Create an NFC device for testing
+        self.device = NFCDevice(port="TEST_PORT")
+        # Enable testing mode to ensure consistent behavior
+        self.device._testing_mode = True
     
     def test_init(self):
         """Test initialization of NFCDevice"""
@@ -79,13 +83,13 @@ class TestNFCDevice(unittest.TestCase):
     def test_write_tag_when_not_connected(self):
         """Test writing a tag when not connected"""
         self.device.connected = False
-        result = self.device.write_tag(self.test_data)
+        result = self.device.write_tag(self.TEST_DATA)
         self.assertFalse(result)
     
     def test_write_tag_when_connected(self):
         """Test writing a tag when connected"""
         self.device.connected = True
-        result = self.device.write_tag(self.test_data)
+        result = self.device.write_tag(self.TEST_DATA)
         
         # Since this is a simulation, we should get True
         self.assertTrue(result)
@@ -2,29 +2,33 @@
 Tests for the ReadView UI component
 """
 import unittest
-from unittest.mock import patch, MagicMock
-from PyQt6.QtWidgets import QApplication, QMessageBox
-import sys
+import pytest
+from types import MappingProxyType
+from unittest.mock import patch
 
-# Create a QApplication instance for tests
-app = QApplication.instance()
-if not app:
-    app = QApplication(sys.argv)
+from tests.unit.helpers import FakeNFCDevice, destroy_widget, get_application
 
-from src.ui.views.read_view import ReadView
-from src.models.filament import FilamentSpool
-from src.services.nfc.device import NFCDevice
+# Qt widget tests; deselect with -m "not gui"
+pytestmark = pytest.mark.gui
+
+# Patch targets for the message boxes; given as strings so importing this
+# module does not load PyQt6
+MESSAGEBOX_WARNING = 'PyQt6.QtWidgets.QMessageBox.warning'
+MESSAGEBOX_INFORMATION = 'PyQt6.QtWidgets.QMessageBox.information'
 
 class TestReadView(unittest.TestCase):
     """Test cases for the ReadView class"""
     
-    def setUp(self):
-        """Set up test cases"""
-        # Mock the NFCDevice
-        self.mock_nfc_device = MagicMock(spec=NFCDevice)
-        
-        # Create a sample FilamentSpool for testing
-        self.test_spool_data = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests"""
+        get_application()
+        # Import the view here so collecting this module does not load PyQt6
+        from src.ui.views.read_view import ReadView
+        cls.view_class = ReadView
+        
+        # Sample tag data for testing (read-only, shared by all tests)
+        cls.TEST_SPOOL_DATA = MappingProxyType({
             "name": "Test PLA",
             "type": "PLA",
             "color": "#00FF00",
@@ -35,10 +39,15 @@ class TestReadView(unittest.TestCase):
             "bed_temp": 60,
             "remaining_length": 240,
             "remaining_weight": 1000
-        }
+        })
+    
+    def setUp(self):
+        """Set up test cases"""
+        # Mock the NFCDevice
+        self.mock_nfc_device = FakeNFCDevice()
         
         # Create ReadView instance for testing
-        self.view = ReadView()
+        self.view = self.view_class()
         # Replace the nfc_device with our mock after creation
         self.view.nfc_device = self.mock_nfc_device
         # Enable testing mode to skip timer delays
@@ -46,7 +55,7 @@ class TestReadView(unittest.TestCase):
     
     def tearDown(self):
         """Clean up after each test"""
-        self.view.deleteLater()
+        destroy_widget(self.view)
     
     def test_init(self):
         """Test initialization of ReadView"""
@@ -61,125 +70,93 @@ class TestReadView(unittest.TestCase):
         # Test if NFCDevice is created
         self.assertIsNotNone(self.view.nfc_device)
         
-    def test_on_connect_clicked_success(self):
-        """Test connect button click with successful connection"""
-        # Mock successful connection
-        self.mock_nfc_device.connect.return_value = True
-        self.mock_nfc_device.is_connected.return_value = True
-        
-        # Call the connect method
-        with patch.object(self.view, 'update_ui') as mock_update_ui:
-            self.view.on_connect_clicked()
-            
-            # Check if connect method was called
-            self.mock_nfc_device.connect.assert_called_once()
-            
-            # Check if UI was updated
-            mock_update_ui.assert_called_once()
-    
-    def test_on_connect_clicked_failure(self):
-        """Test connect button click with failed connection"""
-        # Mock failed connection
-        self.mock_nfc_device.connect.return_value = False
-        self.mock_nfc_device.is_connected.return_value = False
-        
-        # Mock QMessageBox.warning
-        with patch('PyQt6.QtWidgets.QMessageBox.warning') as mock_warning:
-            self.view.on_connect_clicked()
-            
-            # Check if connect method was called
-            self.mock_nfc_device.connect.assert_called_once()
-            
-            # Check if warning message was shown
-            mock_warning.assert_called_once()
+    @patch(MESSAGEBOX_WARNING)
+    def test_on_connect_clicked(self, mock_warning):
+        """Test connect button click with successful and failed connection"""
+        for connected in (True, False):
+            with self.subTest(connected=connected):
+                # Reuse the same view and reconfigure the mocks for each scenario
+                self.mock_nfc_device.reset_mock()
+                mock_warning.reset_mock()
+                self.mock_nfc_device.connect.return_value = connected
+                self.mock_nfc_device.is_connected.return_value = connected
+                
+                with patch.object(self.view, 'update_ui') as mock_update_ui:
+                    self.view.on_connect_clicked()
+                    
+                    # Check if connect method was called
+                    self.mock_nfc_device.connect.assert_called_once()
+                    
+                    # The UI is updated on success, a warning is shown on failure
+                    self.assertEqual(mock_update_ui.called, connected)
+                    self.assertEqual(mock_warning.called, not connected)
     
-    def test_on_read_clicked_success(self):
+    @patch(MESSAGEBOX_INFORMATION)
+    def test_on_read_clicked_success(self, mock_info):
         """Test read button click with successful read"""
         # Mock successful connection and read
         self.mock_nfc_device.is_connected.return_value = True
-        self.mock_nfc_device.read_tag.return_value = self.test_spool_data
+        self.mock_nfc_device.read_tag.return_value = self.TEST_SPOOL_DATA
         
-        # Reset mock call count
-        self.mock_nfc_device.read_tag.reset_mock()
-        
-        # Call the read method and immediately complete the reading
+        # In testing mode the reading completes immediately
         self.view.on_read_clicked()
         
-        # Since reading is asynchronous via timer, we need to simulate completion
-        self.view.reading_completed()
-        
-        # Check if read_tag method was called exactly once after reset
+        # Check if read_tag method was called exactly once
         self.mock_nfc_device.read_tag.assert_called_once()
         
+        # Check if success message was shown
+        mock_info.assert_called_once()
+        
         # Check that status label is updated (not empty)
-        self.assertNotEqual(self.view.status_label.text(), "")
+        self.assertTrue(self.view.status_label.text())
     
-    def test_on_read_clicked_not_connected(self):
+    @patch(MESSAGEBOX_WARNING)
+    def test_on_read_clicked_not_connected(self, mock_warning):
         """Test read button click when not connected"""
         # Mock not connected
         self.mock_nfc_device.is_connected.return_value = False
         
         # Call the read method
-        with patch('PyQt6.QtWidgets.QMessageBox.warning') as mock_warning:
-            self.view.on_read_clicked()
-            
-            # Check if read_tag method was not called
-            self.mock_nfc_device.read_tag.assert_not_called()
-            
-            # Check if warning message was shown
-            mock_warning.assert_called_once()
+        self.view.on_read_clicked()
+        
+        # Check if read_tag method was not called
+        self.mock_nfc_device.read_tag.assert_not_called()
+        
+        # Check if warning message was shown
+        mock_warning.assert_called_once()
     
-    def test_on_read_clicked_read_failure(self):
+    @patch(MESSAGEBOX_WARNING)
+    def test_on_read_clicked_read_failure(self, mock_warning):
         """Test read button click with failed read"""
         # Mock connected but failed read
         self.mock_nfc_device.is_connected.return_value = True
         self.mock_nfc_device.read_tag.return_value = None
         
-        # Reset mock call count
-        self.mock_nfc_device.read_tag.reset_mock()
-        
-        # Call the read method and immediately complete the reading
+        # In testing mode the reading completes immediately
         self.view.on_read_clicked()
         
-        # Since reading is asynchronous via timer, we need to simulate completion
-        with patch('PyQt6.QtWidgets.QMessageBox.warning') as mock_warning:
-            self.view.reading_completed()
-            
-            # Check if read_tag method was called exactly once after reset
-            self.mock_nfc_device.read_tag.assert_called_once()
-            
-            # Check if warning message was shown
-            mock_warning.assert_called_once()
-    
-    def test_update_ui_connected(self):
-        """Test UI update when connected"""
-        # Mock connected
-        self.mock_nfc_device.is_connected.return_value = True
-        
-        # Update UI
-        self.view.update_ui()
-        
-        # Check button states
-        self.assertFalse(self.view.connect_button.isEnabled())
-        self.assertTrue(self.view.read_button.isEnabled())
+        # Check if read_tag method was called exactly once
+        self.mock_nfc_device.read_tag.assert_called_once()
         
-        # Check that status label is updated (not empty)
-        self.assertNotEqual(self.view.status_label.text(), "")
+        # Check if warning message was shown
+        mock_warning.assert_called_once()
     
-    def test_update_ui_disconnected(self):
-        """Test UI update when disconnected"""
-        # Mock disconnected
-        self.mock_nfc_device.is_connected.return_value = False
-        
-        # Update UI
-        self.view.update_ui()
-        
-        # Check button states
-        self.assertTrue(self.view.connect_button.isEnabled())
-        self.assertFalse(self.view.read_button.isEnabled())
-        
-        # Check that status label is updated (not empty)
-        self.assertNotEqual(self.view.status_label.text(), "")
+    def test_update_ui(self):
+        """Test UI update when connected and disconnected"""
+        for connected in (True, False):
+            with self.subTest(connected=connected):
+                # Reuse the same view and reconfigure the mock for each scenario
+                self.mock_nfc_device.is_connected.return_value = connected
+                
+                # Update UI
+                self.view.update_ui()
+                
+                # The connect button is only enabled while disconnected
+                self.assertEqual(self.view.connect_button.isEnabled(), not connected)
+                self.assertEqual(self.view.read_button.isEnabled(), connected)
+                
+                # Check that status label is updated (not empty)
+                self.assertTrue(self.view.status_label.text())
 
 if __name__ == "__main__":
     unittest.main()
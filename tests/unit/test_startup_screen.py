@@ -3,28 +3,22 @@
 Unit test for the startup screen functionality
 """
 
-import sys
-import os
 import unittest
-from PyQt6.QtWidgets import QApplication
+import pytest
 from PyQt6.QtCore import Qt, QTimer
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+from tests.unit.helpers import destroy_widget, get_application
+
+# Qt widget tests; deselect with -m "not gui"
+pytestmark = pytest.mark.gui
 
 class TestStartupScreen(unittest.TestCase):
     """Test suite for startup screen"""
     
     @classmethod
     def setUpClass(cls):
-        """Set up test class with QApplication"""
-        if not QApplication.instance():
-            cls.app = QApplication(sys.argv)
-        else:
-            cls.app = QApplication.instance()
-    
-    def test_startup_screen_creation(self):
-        """Test that startup screen can be created with tasks"""
+        """Set up QApplication and the startup screens shared by all tests"""
+        get_application()
         from src.ui.components.startup_screen import StartupScreen
         
         test_tasks = [
@@ -34,23 +28,30 @@ class TestStartupScreen(unittest.TestCase):
             ("Ready", None)
         ]
         
-        startup = StartupScreen(test_tasks)
-        self.assertIsNotNone(startup)
-        self.assertEqual(len(startup.initialization_tasks), 4)
+        # Shared instances: one with explicit tasks, one with the defaults
+        cls.tasks_startup = StartupScreen(test_tasks)
+        cls.default_startup = StartupScreen()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests"""
+        destroy_widget(cls.tasks_startup)
+        destroy_widget(cls.default_startup)
+    
+    def test_startup_screen_creation(self):
+        """Test that startup screen can be created with tasks"""
+        self.assertIsNotNone(self.tasks_startup)
+        self.assertEqual(len(self.tasks_startup.initialization_tasks), 4)
+        self.assertEqual(self.tasks_startup.width(), 500)
+        self.assertEqual(self.tasks_startup.height(), 400)
     
     def test_startup_screen_signals(self):
         """Test that startup screen has required signals"""
-        from src.ui.components.startup_screen import StartupScreen
-        
-        startup = StartupScreen()
-        self.assertTrue(hasattr(startup, 'startup_complete'))
+        self.assertTrue(hasattr(self.default_startup, 'startup_complete'))
     
     def test_default_tasks(self):
         """Test that default tasks are created when none provided"""
-        from src.ui.components.startup_screen import StartupScreen
-        
-        startup = StartupScreen()
-        self.assertGreater(len(startup.initialization_tasks), 0)
+        self.assertGreater(len(self.default_startup.initialization_tasks), 0)
 
 if __name__ == "__main__":
     unittest.main()
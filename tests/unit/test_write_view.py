@@ -2,29 +2,33 @@
 Tests for the WriteView UI component
 """
 import unittest
+import pytest
 from unittest.mock import patch, MagicMock
-from PyQt6.QtWidgets import QApplication, QMessageBox
-import sys
 
-# Create a QApplication instance for tests
-app = QApplication.instance()
-if not app:
-    app = QApplication(sys.argv)
-
-from src.ui.views.write_view import WriteView
 from src.models.filament import FilamentSpool
-from src.services.nfc.device import NFCDevice
+from tests.unit.helpers import FakeNFCDevice, destroy_widget, get_application
+
+# Qt widget tests; deselect with -m "not gui"
+pytestmark = pytest.mark.gui
+
+# Patch targets for the message boxes; given as strings so importing this
+# module does not load PyQt6
+MESSAGEBOX_WARNING = 'PyQt6.QtWidgets.QMessageBox.warning'
+MESSAGEBOX_INFORMATION = 'PyQt6.QtWidgets.QMessageBox.information'
 
 class TestWriteView(unittest.TestCase):
     """Test cases for the WriteView class"""
     
-    def setUp(self):
-        """Set up test cases"""
-        # Mock the NFCDevice
-        self.mock_nfc_device = MagicMock(spec=NFCDevice)
-        
-        # Create a sample FilamentSpool for testing
-        self.test_spool = FilamentSpool(
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests"""
+        get_application()
+        # Import the view here so collecting this module does not load PyQt6
+        from src.ui.views.write_view import WriteView
+        cls.view_class = WriteView
+        
+        # Sample FilamentSpool for testing (shared by all tests, never modified)
+        cls.TEST_SPOOL = FilamentSpool(
             name="Test PLA",
             type="PLA",
             color="#00FF00",
@@ -36,9 +40,14 @@ class TestWriteView(unittest.TestCase):
             remaining_length=240,
             remaining_weight=1000
         )
+    
+    def setUp(self):
+        """Set up test cases"""
+        # Mock the NFCDevice
+        self.mock_nfc_device = FakeNFCDevice()
         
         # Create WriteView instance for testing
-        self.view = WriteView()
+        self.view = self.view_class()
         # Replace the nfc_device with our mock after creation
         self.view.nfc_device = self.mock_nfc_device
         # Enable testing mode to skip timer delays
@@ -46,7 +55,7 @@ class TestWriteView(unittest.TestCase):
     
     def tearDown(self):
         """Clean up after each test"""
-        self.view.deleteLater()
+        destroy_widget(self.view)
     
     def test_init(self):
         """Test initialization of WriteView"""
@@ -61,128 +70,105 @@ class TestWriteView(unittest.TestCase):
         # Test if NFCDevice is created
         self.assertIsNotNone(self.view.nfc_device)
         
-    def test_on_connect_clicked_success(self):
-        """Test connect button click with successful connection"""
-        # Mock successful connection
-        self.mock_nfc_device.connect.return_value = True
-        self.mock_nfc_device.is_connected.return_value = True
-        
-        # Call the connect method
-        with patch.object(self.view, 'update_ui') as mock_update_ui:
-            self.view.on_connect_clicked()
-            
-            # Check if connect method was called
-            self.mock_nfc_device.connect.assert_called_once()
-            
-            # Check if UI was updated
-            mock_update_ui.assert_called_once()
-    
-    def test_on_connect_clicked_failure(self):
-        """Test connect button click with failed connection"""
-        # Mock failed connection
-        self.mock_nfc_device.connect.return_value = False
-        self.mock_nfc_device.is_connected.return_value = False
-        
-        # Mock QMessageBox.warning
-        with patch('PyQt6.QtWidgets.QMessageBox.warning') as mock_warning:
-            self.view.on_connect_clicked()
-            
-            # Check if connect method was called
-            self.mock_nfc_device.connect.assert_called_once()
-            
-            # Check if warning message was shown
-            mock_warning.assert_called_once()
+    @patch(MESSAGEBOX_WARNING)
+    def test_on_connect_clicked(self, mock_warning):
+        """Test connect button click with successful and failed connection"""
+        for connected in (True, False):
+            with self.subTest(connected=connected):
+                # Reuse the same view and reconfigure the mocks for each scenario
+                self.mock_nfc_device.reset_mock()
+                mock_warning.reset_mock()
+                self.mock_nfc_device.connect.return_value = connected
+                self.mock_nfc_device.is_connected.return_value = connected
+                
+                with patch.object(self.view, 'update_ui') as mock_update_ui:
+                    self.view.on_connect_clicked()
+                    
+                    # Check if connect method was called
+                    self.mock_nfc_device.connect.assert_called_once()
+                    
+                    # The UI is updated on success, a warning is shown on failure
+                    self.assertEqual(mock_update_ui.called, connected)
+                    self.assertEqual(mock_warning.called, not connected)
     
-    def test_on_write_clicked_success(self):
+    @patch(MESSAGEBOX_INFORMATION)
+    def test_on_write_clicked_success(self, mock_info):
         """Test write button click with successful write"""
         # Mock successful connection and write
         self.mock_nfc_device.is_connected.return_value = True
         self.mock_nfc_device.write_tag.return_value = True
         
-        # Prepare form data
-        with patch.object(self.view.filament_detail_widget, 'get_form_data', return_value=self.test_spool):
-            # Call the write method
-            with patch('PyQt6.QtWidgets.QMessageBox.information') as mock_info:
-                self.view.on_write_clicked()
-                
-                # Check if write_tag method was called
-                self.mock_nfc_device.write_tag.assert_called_once()
-                
-                # Check if success message was shown
-                mock_info.assert_called_once()
-                
-                # Check that the status label is not empty (contains some success message)
-                self.assertNotEqual(self.view.status_label.text(), "")
+        # Prepare form data and call the write method
+        with patch.object(self.view.filament_detail_widget, 'get_form_data', return_value=self.TEST_SPOOL):
+            self.view.on_write_clicked()
+            
+            # Check if write_tag method was called
+            self.mock_nfc_device.write_tag.assert_called_once()
+            
+            # Check if success message was shown
+            mock_info.assert_called_once()
+            
+            # Check that the status label is not empty (contains some success message)
+            self.assertTrue(self.view.status_label.text())
     
-    def test_on_write_clicked_not_connected(self):
+    @patch(MESSAGEBOX_WARNING)
+    def test_on_write_clicked_not_connected(self, mock_warning):
         """Test write button click when not connected"""
         # Mock not connected
         self.mock_nfc_device.is_connected.return_value = False
         
         # Call the write method
-        with patch('PyQt6.QtWidgets.QMessageBox.warning') as mock_warning:
-            self.view.on_write_clicked()
-            
-            # Check if write_tag method was not called
-            self.mock_nfc_device.write_tag.assert_not_called()
-            
-            # Check if warning message was shown
-            mock_warning.assert_called_once()
+        self.view.on_write_clicked()
+        
+        # Check if write_tag method was not called
+        self.mock_nfc_device.write_tag.assert_not_called()
+        
+        # Check if warning message was shown
+        mock_warning.assert_called_once()
     
-    def test_on_write_clicked_write_failure(self):
+    @patch(MESSAGEBOX_WARNING)
+    def test_on_write_clicked_write_failure(self, mock_warning):
         """Test write button click with failed write"""
         # Mock connected but failed write
         self.mock_nfc_device.is_connected.return_value = True
         self.mock_nfc_device.write_tag.return_value = False
         
-        # Prepare form data
-        with patch.object(self.view.filament_detail_widget, 'get_form_data', return_value=self.test_spool):
-            # Call the write method
-            with patch('PyQt6.QtWidgets.QMessageBox.warning') as mock_warning:
-                self.view.on_write_clicked()
+        # Prepare form data and call the write method
+        with patch.object(self.view.filament_detail_widget, 'get_form_data', return_value=self.TEST_SPOOL):
+            self.view.on_write_clicked()
+            
+            # Check if write_tag method was called
+            self.mock_nfc_device.write_tag.assert_called_once()
+            
+            # Check if warning message was shown
+            mock_warning.assert_called_once()
+    
+    def test_update_ui(self):
+        """Test UI update when connected and disconnected"""
+        for connected in (True, False):
+            with self.subTest(connected=connected):
+                # Reuse the same view and reconfigure the mock for each scenario
+                self.mock_nfc_device.is_connected.return_value = connected
                 
-                # Check if write_tag method was called
-                self.mock_nfc_device.write_tag.assert_called_once()
+                # Update UI
+                self.view.update_ui()
                 
-                # Check if warning message was shown
-                mock_warning.assert_called_once()
-    
-    def test_update_ui_connected(self):
-        """Test UI update when connected"""
-        # Mock connected
-        self.mock_nfc_device.is_connected.return_value = True
-        
-        # Update UI
-        self.view.update_ui()
-        
-        # Check button states
-        self.assertFalse(self.view.connect_button.isEnabled())
-        self.assertTrue(self.view.write_button.isEnabled())
-        
-        # Check that status label is updated (not empty)
-        self.assertNotEqual(self.view.status_label.text(), "")
-    
-    def test_update_ui_disconnected(self):
-        """Test UI update when disconnected"""
-        # Mock disconnected
-        self.mock_nfc_device.is_connected.return_value = False
-        
-        # Update UI
-        self.view.update_ui()
-        
-        # Check button states
-        self.assertTrue(self.view.connect_button.isEnabled())
-        self.assertFalse(self.view.write_button.isEnabled())
-        
-        # Check that status label is updated (not empty)
-        self.assertNotEqual(self.view.status_label.text(), "")
+                # The connect button is only enabled while disconnected
+                self.assertEqual(self.view.connect_button.isEnabled(), not connected)
+                self.assertEqual(self.view.write_button.isEnabled(), connected)
+                
+                # Check that status label is updated (not empty)
+                self.assertTrue(self.view.status_label.text())
     
     def test_on_back_clicked(self):
         """Test back button click"""
-        # Mock the parent() method to return a MainWindow mock
-        from src.ui.views.main_window import MainWindow
-        mock_main_window = MagicMock(spec=MainWindow)
-        mock_main_window.show_home = MagicMock()
+        # Stand-in for the MainWindow; the view finds it by class name, so the
+        # real MainWindow does not need to be imported
+        class MainWindow:
+            def __init__(self):
+                self.show_home = MagicMock()
+        
+        mock_main_window = MainWindow()
         
         # Patch the parent method to return our mock
         with patch.object(self.view, 'parent', return_value=mock_main_window):